@@ -5,22 +5,24 @@ and normalizes numeric HPO IDs and timestamps.
 """
 
 import click
-import hpotk
 import json
-import pandas as pd  # Not needed for Pandas_Workaround, i.e. don't call declare or call "_read_sheets" at all, just use `tables = load_sheets_as_tables(excel_file)` which only needs `from .loader import load_sheets_as_tables`
+import gzip
+import os
 import pathlib
-import requests
 import sys
 import typing
 
-from collections import defaultdict, namedtuple
+from collections import namedtuple
 from datetime import datetime
-from google.protobuf.json_format import MessageToJson
 from stairval.notepad import create_notepad
-from phenopackets.schema.v2.phenopackets_pb2 import Phenopacket
 
-from .loader import load_sheets_as_tables
-from .mapper import DefaultMapper
+# hpotk, pandas, protobuf/phenopackets and the mapper (which pulls in pyphetools)
+# take around a second to import between them, so they are imported inside the
+# commands that need them; `--help` and `download` never load them.
+if typing.TYPE_CHECKING:
+    import hpotk
+    import pandas as pd  # Not needed for Pandas_Workaround, i.e. don't call declare or call "_read_sheets" at all, just use `tables = load_sheets_as_tables(excel_file)` which only needs `from .loader import load_sheets_as_tables`
+    from phenopackets.schema.v2.phenopackets_pb2 import Phenopacket
 
 AuditEntry = namedtuple("AuditEntry", ["step", "sheet", "message", "level"])
 
@@ -77,6 +79,21 @@ def audit_excel(excel_file: str, report_json: bool):
             click.echo(f"{e.sheet:20}  {e.step:25}  {e.level:8}  {e.message}")
 
 
+_DOWNLOAD_CACHE_NAME = ".hpo_cache.json"
+
+
+def _read_download_cache(cache_file: pathlib.Path) -> dict:
+    """
+    Return the ETag/tag recorded by the previous download, or an empty dict.
+    """
+    try:
+        cached = json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        return {}
+    # a hand-edited or foreign file may hold any JSON value
+    return cached if isinstance(cached, dict) else {}
+
+
 @main.command(name="download")
 @click.option(
     "-d",
@@ -96,7 +113,14 @@ def audit_excel(excel_file: str, report_json: bool):
 def download(data_dir: str, hpo_version: typing.Optional[str]):
     """
     Download a specific or the latest HPO JSON release into the tests/data/ folder.
+
+    The release ETag is remembered next to hp.json, so re-running for the same
+    release gets a 304 from GitHub and leaves the existing file untouched.
     """
+    # only this command talks to the network; keep requests off the import path
+    # of the other commands
+    import requests
+
     datadir = pathlib.Path(data_dir)
     datadir.mkdir(parents=True, exist_ok=True)
     # figure out which tag to download
@@ -114,15 +138,38 @@ def download(data_dir: str, hpo_version: typing.Optional[str]):
         f"releases/download/{tag}/hp.json"
     )
     click.echo(f"Downloading HPO release {tag} …")
-    resp = requests.get(url)
-    resp.raise_for_status()
-
     out = datadir / "hp.json"
-    with open(out, "wb") as f:
-        f.write(resp.content)
-
+    cache_file = datadir / _DOWNLOAD_CACHE_NAME
+    cached = _read_download_cache(cache_file)
+    headers = {}
+    # only revalidate when the file on disk is the same release we fetched before
+    if out.exists() and cached.get("tag") == tag and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    # stream the (~30MB) release straight to disk instead of buffering it in memory
+    with requests.get(url, stream=True, headers=headers) as resp:
+        if resp.status_code == 304:
+            click.echo(f"HPO release {tag} is already up to date at {out}")
+            return
+        resp.raise_for_status()
+        # hp.json is about to change: drop the old entry first, so a failure below
+        # can never leave an ETag vouching for a file that is not that release
+        cache_file.unlink(missing_ok=True)
+        # write next to hp.json and swap it in only once the stream has completed;
+        # open() (unlike mkstemp's 0600) gives the usual umask-derived permissions
+        tmp_out = datadir / "hp.json.part"
+        try:
+            with open(tmp_out, "wb") as f:
+                for chunk in resp.iter_content(chunk_size=1 << 16):
+                    f.write(chunk)
+            os.replace(tmp_out, out)
+        except BaseException:
+            tmp_out.unlink(missing_ok=True)
+            raise
+        etag = resp.headers.get("ETag")
+
+    if etag:
+        cache_file.write_text(json.dumps({"etag": etag, "tag": tag}))
     click.echo(f"Saved HPO JSON to {out}")
-    pass
 
 
 @main.command(name="parse-excel")
@@ -146,6 +193,22 @@ def download(data_dir: str, hpo_version: typing.Optional[str]):
     default=False,
     help=("Treat raw↔HGVS mismatches as errors (default: warn)."),
 )
+@click.option(
+    "--individual-files/--single-archive",
+    default=True,
+    help=(
+        "Write one JSON file per patient (default), or all phenopackets as "
+        "compact JSON lines in a single phenopackets.jsonl.gz."
+    ),
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["json", "pb", "both"]),
+    default="json",
+    show_default=True,
+    help="Per-patient file format: JSON, binary protobuf (.pb), or both.",
+)
 @click.option(
     "--verbose", is_flag=True, help="Show preprocessing and classification steps"
 )
@@ -154,6 +217,8 @@ def parse_excel(
     hpo_path: typing.Optional[str] = None,
     verbose: bool = False,
     strict_variants: bool = False,
+    individual_files: bool = True,
+    output_format: str = "json",
 ):
     """
     Read each sheet, check column order, then:
@@ -162,6 +227,12 @@ def parse_excel(
       - Otherwise skip.
     Instantiate objects accordingly, normalizing HPO IDs & timestamps.
     """
+    if not individual_files and output_format != "json":
+        raise click.UsageError("--single-archive only supports --format json")
+
+    from .loader import iter_sheets_as_tables
+    from .mapper import DefaultMapper
+
     # 1) Load (or locate) the HPO JSON file
     hpo_file = _locate_hpo_file(hpo_path)
 
@@ -169,8 +240,9 @@ def parse_excel(
     ontology = _load_ontology(str(hpo_file))
     mapper = DefaultMapper(ontology, strict_variants=strict_variants)
 
-    # 3) Read all sheets into DataFrames
-    tables = _read_sheets(excel_file)
+    # 3) Read all sheets into DataFrames; the preprocessing audit needs every
+    # sheet, otherwise stream them so the mapper keeps only the ones it uses
+    tables = _read_sheets(excel_file) if verbose else iter_sheets_as_tables(excel_file)
     # tables = load_sheets_as_tables(excel_file)  # Just use this for Pandas_Workaround. Don't call declare or call "_read_sheets" at all. Just use `tables = load_sheets_as_tables(excel_file)` which only needs `from .loader import load_sheets_as_tables`
     # TODO: Decide if it is better to implement `Pandas_Workaround` or just use Pandas
 
@@ -200,16 +272,25 @@ def parse_excel(
     # apply_mapping.8) Serialize phenopackets per patient
     # phenopackets = mapper.apply_mapping(tables, notepad)
     output_dir = _prepare_output_dir()
-    count = 0
-    for pkt in phenopackets:
-        with open(output_dir / f"{count + 1}.json", "w", encoding="utf-8") as out_f:
-            out_f.write(MessageToJson(pkt))
-        count += 1
-        # Use mapper.stats["patients"] instead of len(records_by_patient)
-    # apply_mapping.9) Final summary
-    click.echo(
-        f"Wrote {mapper.stats.get('patients', count)} phenopacket files to {output_dir}"
-    )
+    if individual_files:
+        count = 0
+        write_json = output_format in ("json", "both")
+        write_pb = output_format in ("pb", "both")
+        for pkt in phenopackets:
+            if write_json:
+                _write_phenopacket_json(pkt, output_dir / f"{count + 1}.json")
+            if write_pb:
+                _write_phenopacket_pb(pkt, output_dir / f"{count + 1}.pb")
+            count += 1
+            # Use mapper.stats["patients"] instead of len(records_by_patient)
+        # apply_mapping.9) Final summary
+        click.echo(
+            f"Wrote {mapper.stats.get('patients', count)} phenopacket files to {output_dir}"
+        )
+    else:
+        archive = output_dir / "phenopackets.jsonl.gz"
+        count = _write_phenopacket_archive(phenopackets, archive)
+        click.echo(f"Wrote {count} phenopackets to {archive}")
     # TODO: Come back and add more top-level fields
 
     # 5) Report any errors or warnings
@@ -244,13 +325,17 @@ def _locate_hpo_file(hpo_path: typing.Optional[str]) -> pathlib.Path:
     return hpo_file
 
 
-def _load_ontology(hpo_file: str) -> hpotk.MinimalOntology:
+def _load_ontology(hpo_file: str) -> "hpotk.MinimalOntology":
+    import hpotk
+
     # load ontology from JSON
     return hpotk.load_minimal_ontology(hpo_file)
 
 
 # Comment out this function and all uses to just get a Pandas_Workaround by only using the original `tables = load_sheets_as_tables(excel_file)`, which only depends on `from .loader import load_sheets_as_tables`
-def _read_sheets(excel_file: str) -> dict[str, pd.DataFrame]:
+def _read_sheets(excel_file: str) -> dict[str, "pd.DataFrame"]:
+    from .loader import load_sheets_as_tables
+
     # read each worksheet into a DataFrame
     return load_sheets_as_tables(excel_file)
 
@@ -275,27 +360,16 @@ def _group_records_by_patient(
     measurement_records: list,
     biosample_records: list,
 ) -> dict[str, dict[str, list]]:
-    # Group genotype & phenotype records by patient ID
-    records = defaultdict(
-        lambda: {
-            "genotype_records": [],
-            "phenotype_records": [],
-            "disease_records": [],
-            "measurement_records": [],
-            "biosample_records": [],
-        }
+    # Group all record types by patient ID, exactly as parse-excel does
+    from .mapper import DefaultMapper
+
+    return DefaultMapper._group_records_by_patient(
+        genotype_records,
+        phenotype_records,
+        disease_records,
+        measurement_records,
+        biosample_records,
     )
-    for genotype in genotype_records:
-        records[genotype.genotype_patient_ID]["genotype_records"].append(genotype)
-    for phenotype in phenotype_records:
-        records[phenotype.phenotype_patient_ID]["phenotype_records"].append(phenotype)
-    for disease in disease_records:
-        records[disease.patient_ID]["disease_records"].append(disease)
-    for measurement in measurement_records:
-        records[measurement.patient_ID]["measurement_records"].append(measurement)
-    for biosample in biosample_records:
-        records[biosample.patient_ID]["biosample_records"].append(biosample)
-    return records
 
 
 # 7) Prepare output directory with timestamp
@@ -314,6 +388,8 @@ def _write_phenopackets(
     records_by_patient: dict[str, dict[str, list]],
     generated_phenopacket_output_dir: pathlib.Path,
 ):
+    from phenopackets.schema.v2.phenopackets_pb2 import Phenopacket
+
     # Build and write one Phenopacket per patient
     for patient_id, patient_data in records_by_patient.items():
         phenopacket = Phenopacket()
@@ -384,14 +460,42 @@ def _write_phenopackets(
             bs.collection_time = b.collection_date
 
         # 3d) Serialize to JSON
-        generated_phenopacket_output_path = (
-            generated_phenopacket_output_dir / f"{patient_id}.json"
+        _write_phenopacket_json(
+            phenopacket, generated_phenopacket_output_dir / f"{patient_id}.json"
         )
-        with open(generated_phenopacket_output_path, "w", encoding="utf-8") as out_f:
-            out_f.write(MessageToJson(phenopacket))
 
 
-def preprocess(tables: dict[str, pd.DataFrame]) -> list[AuditEntry]:
+def _write_phenopacket_json(phenopacket: "Phenopacket", path: pathlib.Path) -> None:
+    from google.protobuf.json_format import MessageToJson
+
+    # Encode once and hand the OS a single bytes buffer: skips the text-mode
+    # TextIOWrapper layer and its chunked encode/flush of the JSON string.
+    path.write_bytes(MessageToJson(phenopacket).encode("utf-8"))
+
+
+def _write_phenopacket_pb(phenopacket: "Phenopacket", path: pathlib.Path) -> None:
+    # Binary wire format: much smaller and cheaper to produce than JSON, for
+    # downstream tooling that reads protobuf directly.
+    path.write_bytes(phenopacket.SerializeToString())
+
+
+def _write_phenopacket_archive(
+    phenopackets: typing.Iterable["Phenopacket"], path: pathlib.Path
+) -> int:
+    from google.protobuf.json_format import MessageToJson
+
+    # One gzip member with a compact JSON document per line: a single file
+    # entry for the whole cohort instead of one inode per patient.
+    count = 0
+    with gzip.open(path, "wb", compresslevel=1) as f:
+        for phenopacket in phenopackets:
+            f.write(MessageToJson(phenopacket, indent=None).encode("utf-8"))
+            f.write(b"\n")
+            count += 1
+    return count
+
+
+def preprocess(tables: dict[str, "pd.DataFrame"]) -> list[AuditEntry]:
     """
     Run lightweight audits on each sheet:
       - header normalization
@@ -399,17 +503,22 @@ def preprocess(tables: dict[str, pd.DataFrame]) -> list[AuditEntry]:
       - variant‐column presence (raw vs HGVS)
     """
     from .mapper import (
-        RAW_VARIANT_COLUMNS,
-        HGVS_VARIANT_COLUMNS,
         GENOTYPE_BASE_COLUMNS,
+        HGVS_VARIANT_COLUMNS,
         PHENOTYPE_KEY_COLUMNS,
+        RAW_VARIANT_COLUMNS,
     )
 
-    entries: list[AuditEntry] = []
+    # Single pass over the sheets: build each column set once, derive every check.
+    # Entries are kept in per-step lists so the report still lists all header
+    # counts first, then classifications, then variant-column errors.
+    header_entries: list[AuditEntry] = []
+    classify_entries: list[AuditEntry] = []
+    variant_entries: list[AuditEntry] = []
 
-    # Step 1: header counts
     for name, df in tables.items():
-        entries.append(
+        # Step 1: header counts
+        header_entries.append(
             AuditEntry(
                 step="normalize-headers",
                 sheet=name,
@@ -418,16 +527,16 @@ def preprocess(tables: dict[str, pd.DataFrame]) -> list[AuditEntry]:
             )
         )
 
-    # Step 2: classify
-    for name, df in tables.items():
+        # Step 2: classify
         cols = set(df.columns)
         has_raw = RAW_VARIANT_COLUMNS.issubset(cols)
         has_hgvs = bool(HGVS_VARIANT_COLUMNS & cols)
-        is_gen = GENOTYPE_BASE_COLUMNS.issubset(cols) and (has_raw or has_hgvs)
+        has_base = GENOTYPE_BASE_COLUMNS.issubset(cols)
+        is_gen = has_base and (has_raw or has_hgvs)
         is_pheno = PHENOTYPE_KEY_COLUMNS.issubset(cols)
 
         kind = "genotype" if is_gen else "phenotype" if is_pheno else "skip"
-        entries.append(
+        classify_entries.append(
             AuditEntry(
                 step="classify-sheet",
                 sheet=name,
@@ -439,20 +548,18 @@ def preprocess(tables: dict[str, pd.DataFrame]) -> list[AuditEntry]:
             )
         )
 
-    # Step 3: variant columns
-    for name, df in tables.items():
-        cols = set(df.columns)
-        if GENOTYPE_BASE_COLUMNS.issubset(cols):
-            if not (RAW_VARIANT_COLUMNS.issubset(cols) or HGVS_VARIANT_COLUMNS & cols):
-                entries.append(
-                    AuditEntry(
-                        step="variant-check",
-                        sheet=name,
-                        message="missing raw & HGVS",
-                        level="error",
-                    )
+        # Step 3: variant columns
+        if has_base and not (has_raw or has_hgvs):
+            variant_entries.append(
+                AuditEntry(
+                    step="variant-check",
+                    sheet=name,
+                    message="missing raw & HGVS",
+                    level="error",
                 )
-    return entries
+            )
+
+    return header_entries + classify_entries + variant_entries
 
 
 if __name__ == "__main__":
@@ -7,7 +7,7 @@ Defines the BiosampleRecord dataclass for capturing sample metadata.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class BiosampleRecord:
     """
     Represents a biosample entry for a patient.
@@ -7,7 +7,7 @@ Defines the DiseaseRecord dataclass for capturing disease annotations.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class DiseaseRecord:
     """
     Represents a disease entry for a patient.
@@ -22,37 +22,42 @@ VariantDescriptor construction strategy:
 Environment flags
 ----------------------------------------
 P6_SKIP_VV=1           : Force the local fallback path (useful for CI/offline).
+P6_VV_CACHE=0          : Do not read or write the on-disk VV response cache
+                         ($XDG_CACHE_HOME/P6/vv.sqlite3, by default
+                         ~/.cache/P6/vv.sqlite3); on by default.
+P6_VV_CACHE_PATH=...   : Location of that cache file.
 P6_ENRICH_GENE_XREFS=1 : If set and vv_lookup is importable, ask VV for HGNC/
                          Ensembl IDs and add them to gene_context where possible.
 """
 
 from __future__ import annotations
 
+import logging
 import os
 import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Mapping, Optional, Sequence, Tuple
 
-import requests
 import phenopackets.schema.v2 as pps2
-from pyphetools.creation.variant_validator import VariantValidator
 
+_LOGGER = logging.getLogger(__name__)
 
 # ----------------------------------
 # Patterns and small constant tables
 # ----------------------------------
 
-_VALID_ID = re.compile(r"^[A-Za-z0-9]+$")
 _EMAIL_PATTERN = re.compile(r"^[\w\.\+\-]+@[\w\.\-]+\.[A-Za-z]+$")
-_ALLOWED_CHROM_ENCODINGS = {"hgvs", "ucsc", "refseq", "ensembl", "ncbi", "ega"}
-_ALLOWED_ZYGOSITIES = {
-    "compound_heterozygosity",
-    "homozygous",
-    "heterozygous",
-    "hemizygous",
-    "mosaic",
-}
-_ALLOWED_INHERITANCE_MODES = {"unknown", "inherited", "de_novo_mutation"}
+_EMAIL_MATCH = _EMAIL_PATTERN.match
+_ALLOWED_CHROM_ENCODINGS = frozenset(
+    {"hgvs", "ucsc", "refseq", "ensembl", "ncbi", "ega"}
+)
+_ALLOWED_INHERITANCE_MODES = frozenset({"unknown", "inherited", "de_novo_mutation"})
 
 # GENO allelic_state codes mapped from normalized zygosity terms
 _GENO_ALLELIC_STATE_CODES = {
@@ -62,6 +67,12 @@ _GENO_ALLELIC_STATE_CODES = {
     "hemizygous": "0000136",
     "mosaic": "0000150",
 }
+# Derived from the code table so every accepted zygosity has a GENO code
+_ALLOWED_ZYGOSITIES = frozenset(_GENO_ALLELIC_STATE_CODES)
+# Full CURIEs for the same table, so descriptors don't format "GENO:…" per call
+_GENO_ALLELIC_STATE_IDS = {
+    zygosity: f"GENO:{code}" for zygosity, code in _GENO_ALLELIC_STATE_CODES.items()
+}
 
 # Permissive HGVS g. SNV pattern with optional "chr" prefix (captures chrom/pos/ref/alt)
 _HGVS_G_SNV = re.compile(
@@ -75,6 +86,11 @@ _HGVS_G_SNV = re.compile(
     """,
     re.IGNORECASE | re.VERBOSE,
 )
+_HGVSG_MATCH = _HGVS_G_SNV.match
+
+# Characters accepted by the fast path in _normalize_g_expression
+_SNV_BASES = frozenset("ACGT")
+_SNV_NAMED_CHROMS = frozenset({"X", "Y", "M"})
 
 # Transcript + c. part, e.g. "NM_000000.0:c.100A>G", "ENST00000205557.12:c.2428G>A"
 _HGVSC_TXT_RE = re.compile(
@@ -89,6 +105,252 @@ _HGVSC_TXT_RE = re.compile(
     """,
     re.IGNORECASE | re.VERBOSE,
 )
+_HGVSC_MATCH = _HGVSC_TXT_RE.match
+
+
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, "").strip().lower() in {"1", "true"}
+
+
+def _env_enabled(name: str) -> bool:
+    # opt-out flag: anything but "0"/"false" (including unset) means enabled
+    return os.getenv(name, "").strip().lower() not in {"0", "false"}
+
+
+# Environment flags are read once at import instead of on every descriptor build;
+# call refresh_env_flags() after changing the environment in-process (tests).
+def _env_cache_path() -> Path:
+    override = os.getenv("P6_VV_CACHE_PATH", "").strip()
+    if override:
+        return Path(override).expanduser()
+    # XDG base directory spec: $XDG_CACHE_HOME if set (and absolute), else ~/.cache
+    cache_home = os.getenv("XDG_CACHE_HOME", "").strip()
+    if not cache_home or not os.path.isabs(cache_home):
+        cache_home = Path.home() / ".cache"
+    return Path(cache_home) / "P6" / "vv.sqlite3"
+
+
+_SKIP_VV = _env_flag("P6_SKIP_VV")
+_VV_CACHE = _env_enabled("P6_VV_CACHE")
+_VV_CACHE_PATH = _env_cache_path()
+
+
+def refresh_env_flags() -> None:
+    """Re-read the P6_* environment flags into their module-level values."""
+    global _SKIP_VV, _VV_CACHE, _VV_CACHE_PATH
+    _SKIP_VV = _env_flag("P6_SKIP_VV")
+    _VV_CACHE = _env_enabled("P6_VV_CACHE")
+    _VV_CACHE_PATH = _env_cache_path()
+
+
+# ------------------------------
+# Persistent VV response cache
+# ------------------------------
+
+_GENOME_BUILD = "GRCh38"
+# Oldest entries are evicted past this size (~kB each, so roughly a GB at most)
+_VV_CACHE_MAX_ENTRIES = 1_000_000
+# one connection shared by the prefetch threads; sqlite3 objects are not
+# safe for concurrent use, so every statement runs under this lock
+_vv_db_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _open_vv_db(path: Path) -> Optional[sqlite3.Connection]:
+    """Open (creating if needed) the cache database, or None if that fails."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(path), check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS vv_descriptor ("
+            " genome_build TEXT, tx TEXT, c_part TEXT, descriptor BLOB,"
+            " PRIMARY KEY (genome_build, tx, c_part))"
+        )
+    except (OSError, sqlite3.Error):
+        return None
+    return conn
+
+
+def _vv_disk_get(tx: str, c_part: str) -> Optional[bytes]:
+    """Return a previously stored serialized descriptor, or None."""
+    if not _VV_CACHE:
+        return None
+    conn = _open_vv_db(_VV_CACHE_PATH)
+    if conn is None:
+        return None
+    try:
+        with _vv_db_lock:
+            row = conn.execute(
+                "SELECT descriptor FROM vv_descriptor"
+                " WHERE genome_build = ? AND tx = ? AND c_part = ?",
+                (_GENOME_BUILD, tx, c_part),
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+    return row[0] if row else None
+
+
+def _vv_disk_put(tx: str, c_part: str, payload: bytes) -> None:
+    """Store a serialized descriptor; cache write failures are not fatal."""
+    if not _VV_CACHE:
+        return
+    conn = _open_vv_db(_VV_CACHE_PATH)
+    if conn is None:
+        return
+    try:
+        with _vv_db_lock, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO vv_descriptor VALUES (?, ?, ?, ?)",
+                (_GENOME_BUILD, tx, c_part, payload),
+            )
+            # rowids grow with every write, so this drops the oldest entries
+            # first; a rowid range delete is cheap when nothing falls in range
+            conn.execute(
+                "DELETE FROM vv_descriptor"
+                " WHERE rowid <= (SELECT max(rowid) FROM vv_descriptor) - ?",
+                (_VV_CACHE_MAX_ENTRIES,),
+            )
+    except sqlite3.Error:
+        pass
+
+
+@lru_cache(maxsize=None)
+def _variant_validator_class() -> type:
+    """
+    Import pyphetools' VariantValidator on first use only. pyphetools pulls in
+    matplotlib at import time (~0.5s), which callers that never reach the VV
+    path (P6_SKIP_VV, the download command, --help) should not pay for.
+    """
+    from pyphetools.creation.variant_validator import VariantValidator
+
+    return VariantValidator
+
+
+class _PooledRequests:
+    """
+    Stand-in for the `requests` module whose get() goes through the pooled VV
+    session with a timeout; every other attribute is the real module's.
+    """
+
+    def __init__(self, real_requests) -> None:
+        self._real = real_requests
+
+    def get(self, url, **kwargs):
+        from .vv_lookup import REQUEST_TIMEOUT, SESSION
+
+        kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+        return SESSION.get(url, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._real, name)
+
+
+class _PooledVVRequests:
+    """
+    Context manager that points pyphetools' variant_validator module at
+    _PooledRequests while any VV call is in flight, and restores the real
+    `requests` once the last one (across threads) has finished.
+
+    VariantValidator takes no session argument and calls the module-level
+    `requests.get` without a timeout, so otherwise every variant opens a new
+    connection (and TLS handshake) and a stalled one blocks forever.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._depth = 0
+        self._original = None
+
+    def __enter__(self) -> None:
+        from pyphetools.creation import variant_validator
+
+        with self._lock:
+            if self._depth == 0:
+                self._original = variant_validator.requests
+                variant_validator.requests = _PooledRequests(self._original)
+            self._depth += 1
+
+    def __exit__(self, *exc_info) -> None:
+        from pyphetools.creation import variant_validator
+
+        with self._lock:
+            self._depth -= 1
+            if self._depth == 0:
+                variant_validator.requests = self._original
+                self._original = None
+
+
+_vv_pooled_requests = _PooledVVRequests()
+
+
+# VariantValidator asks clients to stay at or below ~15 requests per second.
+_VV_MAX_REQUESTS_PER_SECOND = 15.0
+
+
+class _RateLimiter:
+    """
+    Space calls at least 1/rate seconds apart, across threads. Each caller
+    reserves the next free slot under the lock and sleeps outside it.
+    """
+
+    def __init__(self, rate: float) -> None:
+        self._interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+_vv_rate_limiter = _RateLimiter(_VV_MAX_REQUESTS_PER_SECOND)
+
+
+@lru_cache(maxsize=4096)
+def _vv_encode(tx: str, c_part: str) -> Optional[bytes]:
+    """
+    Ask VariantValidator for the descriptor of transcript `tx` + `c_part` and
+    return it serialized, or None if VV failed or returned an unusable payload.
+
+    Every call is an HTTPS round-trip, and cohorts repeat variants, so results
+    (failures included) are memoized per process. Bytes rather than the message
+    are cached because callers enrich the descriptor in place; each caller
+    parses its own copy. Successful lookups are also persisted on disk so later
+    runs over the same workbook skip the network; failures are not, since they
+    are usually transient.
+    """
+    payload = _vv_disk_get(tx, c_part)
+    if payload is not None:
+        return payload
+    # deferred like pyphetools: P6_SKIP_VV runs never need the HTTP stack
+    import requests
+
+    # only real VV round-trips are throttled; memory/disk hits return above
+    _vv_rate_limiter.wait()
+    try:
+        vv = _variant_validator_class()(genome_build=_GENOME_BUILD, transcript=tx)
+        with _vv_pooled_requests:
+            hv = vv.encode_hgvs(c_part)  # pyphetools expects ONLY the c. part
+        vi = hv.to_variant_interpretation_202()
+        # pyphetools returns its own wrapper; to_message() gives the protobuf
+        payload = vi.variation_descriptor.to_message().SerializeToString()
+    except (
+        requests.RequestException,
+        ValueError,
+        TypeError,
+        AttributeError,
+        KeyError,
+    ) as e:
+        _LOGGER.debug(
+            "VV lookup failed for %s:%s, using local descriptor: %r", tx, c_part, e
+        )
+        return None
+    _vv_disk_put(tx, c_part, payload)
+    return payload
 
 
 # ----------------------
@@ -96,7 +358,7 @@ _HGVSC_TXT_RE = re.compile(
 # ----------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Genotype:
     """
     Represents a single genomic variant call for a patient.
@@ -139,34 +401,24 @@ class Genotype:
 
     def __post_init__(self) -> None:
         """Validate basic identifier formats and required string fields."""
-        if not _VALID_ID.match(self.genotype_patient_ID):
-            raise ValueError(f"Invalid patient ID: {self.genotype_patient_ID!r}")
+        # ASCII-alphanumeric and non-empty (isalnum() is False for ""); plain str
+        # methods are about twice as fast as matching ^[A-Za-z0-9]+$
+        patient_id = self.genotype_patient_ID
+        if not (
+            isinstance(patient_id, str)
+            and patient_id.isascii()
+            and patient_id.isalnum()
+        ):
+            raise ValueError(f"Invalid patient ID: {patient_id!r}")
 
-        if not _EMAIL_PATTERN.match(self.contact_email):
+        if not _EMAIL_MATCH(self.contact_email):
             raise ValueError(f"Invalid contact email: {self.contact_email!r}")
 
         chrom_lower = self.chromosome.lower()
-        if not (
-            chrom_lower in _ALLOWED_CHROM_ENCODINGS or chrom_lower.startswith("chr")
-        ):
+        if not (chrom_lower in _ALLOWED_CHROM_ENCODINGS or chrom_lower[:3] == "chr"):
             raise ValueError(f"Unrecognized chromosome: {self.chromosome!r}")
 
-        for attr in ("start_position", "end_position"):
-            val = getattr(self, attr)
-            if not isinstance(val, int) or val < 0:
-                raise ValueError(f"{attr} must be a non-negative integer, got {val!r}")
-
-        for attr in (
-            "reference",
-            "alternate",
-            "gene_symbol",
-            "hgvsg",
-            "hgvsc",
-            "hgvsp",
-        ):
-            val = getattr(self, attr)
-            if not isinstance(val, str) or not val.strip():
-                raise ValueError(f"{attr} must be a nonempty string")
+        self._validate_variant_fields()
 
         if self.zygosity not in _ALLOWED_ZYGOSITIES:
             raise ValueError(f"Invalid zygosity: {self.zygosity!r}")
@@ -174,6 +426,35 @@ class Genotype:
         if self.inheritance not in _ALLOWED_INHERITANCE_MODES:
             raise ValueError(f"Invalid inheritance mode: {self.inheritance!r}")
 
+    def _validate_variant_fields(self) -> None:
+        """
+        Positions must be non-negative ints, allele/gene/HGVS fields nonempty strings.
+        Written out field by field rather than as a getattr-by-name loop, since it
+        runs once per genotype row. `type(x) is int` also rejects bools.
+        """
+        start, end = self.start_position, self.end_position
+        if type(start) is not int or start < 0:
+            raise ValueError(
+                f"start_position must be a non-negative integer, got {start!r}"
+            )
+        if type(end) is not int or end < 0:
+            raise ValueError(
+                f"end_position must be a non-negative integer, got {end!r}"
+            )
+
+        if not (isinstance(self.reference, str) and self.reference.strip()):
+            raise ValueError("reference must be a nonempty string")
+        if not (isinstance(self.alternate, str) and self.alternate.strip()):
+            raise ValueError("alternate must be a nonempty string")
+        if not (isinstance(self.gene_symbol, str) and self.gene_symbol.strip()):
+            raise ValueError("gene_symbol must be a nonempty string")
+        if not (isinstance(self.hgvsg, str) and self.hgvsg.strip()):
+            raise ValueError("hgvsg must be a nonempty string")
+        if not (isinstance(self.hgvsc, str) and self.hgvsc.strip()):
+            raise ValueError("hgvsc must be a nonempty string")
+        if not (isinstance(self.hgvsp, str) and self.hgvsp.strip()):
+            raise ValueError("hgvsp must be a nonempty string")
+
     # ----------------------
     # Convenience properties
     # ----------------------
@@ -181,18 +462,19 @@ class Genotype:
     @property
     def zygosity_code(self) -> str:
         """Return the numeric part of the GENO: allelic_state code for this zygosity."""
-        try:
-            return _GENO_ALLELIC_STATE_CODES[self.zygosity]
-        except KeyError as e:
-            raise ValueError(
-                f"No GENO code defined for zygosity {self.zygosity!r}"
-            ) from e
+        return _GENO_ALLELIC_STATE_CODES[self.zygosity]
+
+    def _allelic_state_id(self) -> str:
+        """GENO CURIE for this zygosity."""
+        return _GENO_ALLELIC_STATE_IDS[self.zygosity]
 
     # --------------------------------------------------------------------------
     # Core responsibility: build a VariationDescriptor (VV path or local fallback)
     # --------------------------------------------------------------------------
 
-    def to_variation_descriptor(self) -> "pps2.VariationDescriptor":
+    def to_variation_descriptor(
+        self, vv_payloads: Optional[Mapping[Tuple[str, str], Optional[bytes]]] = None
+    ) -> "pps2.VariationDescriptor":
         """
         Build a GA4GH VariationDescriptor for this variant.
 
@@ -202,41 +484,70 @@ class Genotype:
            - If VV returns a usable object: enrich & return.
            - On VV/network/shape issues: build locally.
         All paths de-duplicate expressions to avoid double g.HGVS entries.
+
+        `vv_payloads` is the mapping returned by prefetch_variant_validator; pairs
+        found there are used as-is instead of being looked up again.
         """
-        if os.getenv("P6_SKIP_VV", "").strip().lower() in {"1", "true"}:
-            vd = self._build_local_descriptor()
-            return self._enrich_descriptor_common(vd)
-
-        tx, c_part = self._parse_hgvsc(self.hgvsc)
-        if not (tx and c_part):
-            vd = self._build_local_descriptor()
-            return self._enrich_descriptor_common(vd)
-
-        # Try building via VariantValidator; keep failures graceful.
-        try:
-            vv = VariantValidator(genome_build="GRCh38", transcript=tx)
-            hv = vv.encode_hgvs(c_part)  # pyphetools expects ONLY the c. part
-            vi = hv.to_variant_interpretation_202()
-            vd = vi.variation_descriptor
-        except (
-            requests.RequestException,
-            ValueError,
-            TypeError,
-            AttributeError,
-            KeyError,
-        ):
-            vd = self._build_local_descriptor()
+        # normalized once and shared by whichever builder runs below
+        g_value = self._normalize_g_expression(self.hgvsg)
+
+        vd = None
+        if not _SKIP_VV:
+            tx, c_part = self._parse_hgvsc(self.hgvsc)
+            if tx and c_part:
+                # Try building via VariantValidator; keep failures graceful.
+                vd = self._try_build_descriptor_via_vv(tx, c_part, vv_payloads)
 
-        return self._enrich_descriptor_common(vd)
+        if vd is None:
+            # The local builder already sets allelic state, gene symbol and the
+            # g. expression, so the common enrichment pass would be a no-op.
+            return self._build_local_descriptor(g_value)
+        return self._enrich_descriptor_common(vd, g_value)
+
+    @classmethod
+    def bulk_to_variation_descriptors(
+        cls, genotypes: Sequence[Genotype], max_workers: int = 8
+    ) -> list["pps2.VariationDescriptor"]:
+        """
+        Build descriptors for many genotypes, in input order. The VV lookups for
+        the distinct (transcript, c.) pairs are issued concurrently first; the
+        per-genotype build and local enrichment then run serially from those results.
+        """
+        vv_payloads = cls.prefetch_variant_validator(genotypes, max_workers=max_workers)
+        return [genotype.to_variation_descriptor(vv_payloads) for genotype in genotypes]
+
+    @classmethod
+    def prefetch_variant_validator(
+        cls, genotypes: Iterable[Genotype], max_workers: int = 8
+    ) -> Dict[Tuple[str, str], Optional[bytes]]:
+        """
+        Look up every distinct (transcript, c.) pair in `genotypes` and return the
+        serialized VV descriptors (None for failures) keyed by pair, to be passed
+        to to_variation_descriptor. Returning them, rather than relying on the
+        bounded in-process memo, keeps large batches from evicting early results
+        before they are used. VV calls are I/O-bound HTTPS round-trips, so a small
+        thread pool recovers most of the time N sequential calls would take.
+        Returns an empty dict when P6_SKIP_VV is set.
+        """
+        if _SKIP_VV:
+            return {}
+        pairs = {cls._parse_hgvsc(genotype.hgvsc) for genotype in genotypes}
+        pending = [(tx, c_part) for tx, c_part in pairs if tx and c_part]
+        if not pending:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+            return dict(zip(pending, pool.map(lambda pair: _vv_encode(*pair), pending)))
 
     # -----------------------
     # Internal helper methods
     # -----------------------
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _parse_hgvsc(hgvsc: str) -> Tuple[Optional[str], Optional[str]]:
         """
         Extract transcript identifier and the c. part from an hgvsc string.
+        Memoized: the same transcript/c. strings recur across rows and patients.
 
         Examples:
             "NM_000000.0:c.100A>G" -> ("NM_000000.0", "c.100A>G")
@@ -244,7 +555,7 @@ class Genotype:
         """
         if not isinstance(hgvsc, str):
             return None, None
-        m = _HGVSC_TXT_RE.match(hgvsc.strip())
+        m = _HGVSC_MATCH(hgvsc.strip())
         if not m:
             return None, None
         return m.group("tx"), m.group("c")
@@ -258,7 +569,24 @@ class Genotype:
         if not isinstance(hgvsg, str) or not hgvsg.strip():
             return None
         s = hgvsg.strip()
-        m = _HGVS_G_SNV.match(s)
+        # Fast path for the canonical form ("chr16:g.100A>G" / "16:g.100A>G"): it
+        # is already normalized once "chr" is dropped, so return that slice with
+        # no regex match, group extraction or re-formatting. Anything else (case
+        # variants, multi-base alleles, non-SNVs) goes through the regex below.
+        body = s[3:] if s[:3] == "chr" else s
+        chrom, sep, rest = body.partition(":g.")
+        if (
+            sep
+            and len(rest) > 3
+            and rest[-2] == ">"
+            and rest[-3] in _SNV_BASES
+            and rest[-1] in _SNV_BASES
+            and rest[:-3].isdigit()
+            and rest[:-3].isascii()
+            and (chrom in _SNV_NAMED_CHROMS or (chrom.isdigit() and chrom.isascii()))
+        ):
+            return body
+        m = _HGVSG_MATCH(s)
         if m:
             chrom = m.group("chrom")
             pos = m.group("pos")
@@ -271,77 +599,89 @@ class Genotype:
 
     # ---- Descriptor builders --------------------------------------------------
 
-    def _build_local_descriptor(self) -> "pps2.VariationDescriptor":
+    @staticmethod
+    def _try_build_descriptor_via_vv(
+        tx: str,
+        c_part: str,
+        vv_payloads: Optional[Mapping[Tuple[str, str], Optional[bytes]]] = None,
+    ) -> Optional["pps2.VariationDescriptor"]:
+        """
+        Return a fresh VariationDescriptor from the prefetched payloads or the
+        (memoized) VV lookup, or None when VV could not produce one.
+        """
+        if vv_payloads is not None and (tx, c_part) in vv_payloads:
+            payload = vv_payloads[(tx, c_part)]
+        else:
+            payload = _vv_encode(tx, c_part)
+        if payload is None:
+            return None
+        vd = pps2.VariationDescriptor()
+        vd.ParseFromString(payload)
+        return vd
+
+    def _build_local_descriptor(
+        self, g_value: Optional[str]
+    ) -> "pps2.VariationDescriptor":
         """
-        Construct a minimal local VariationDescriptor using normalized g.HGVS,
-        gene symbol, and zygosity. Used when VV is unavailable or disabled.
+        Construct a minimal local VariationDescriptor using normalized g.HGVS
+        (`g_value`, from _normalize_g_expression), gene symbol, and zygosity.
+        Used when VV is unavailable or disabled.
         """
         vd = pps2.VariationDescriptor()
 
         # Add g. expression if present (local path never has any expressions yet)
-        g_value = self._normalize_g_expression(self.hgvsg)
         if g_value:
-            self._add_hgvs_expression(vd, g_value, syntax_name="HGVS")
+            self._add_hgvs_expression(vd, g_value)
 
         # Allelic state (GENO)
         if self.zygosity:
-            vd.allelic_state.id = f"GENO:{self.zygosity_code}"
+            vd.allelic_state.id = self._allelic_state_id()
             vd.allelic_state.label = self.zygosity
 
         # Gene context (optional)
         if self.gene_symbol:
-            try:
-                vd.gene_context.symbol = self.gene_symbol
-            except (AttributeError, TypeError):
-                # Do not let proto accessors sink the run
-                pass
+            vd.gene_context.symbol = self.gene_symbol
 
         return vd
 
     def _enrich_descriptor_common(
-        self, vd: "pps2.VariationDescriptor"
+        self, vd: "pps2.VariationDescriptor", g_value: Optional[str]
     ) -> "pps2.VariationDescriptor":
         """
-        Common post-processing for both VV-built and locally-built descriptors:
+        Post-processing for VV-built descriptors:
         - ensure allelic_state matches our zygosity,
         - ensure gene_context has our gene symbol (if missing),
-        - ensure a normalized g.HGVS expression is present exactly once.
+        - ensure the normalized g.HGVS (`g_value`) is present exactly once.
         """
         # Allelic state
         if self.zygosity:
-            vd.allelic_state.id = f"GENO:{self.zygosity_code}"
+            vd.allelic_state.id = self._allelic_state_id()
             vd.allelic_state.label = self.zygosity
 
         # Gene symbol (do not overwrite a non-empty symbol VV may have provided)
-        try:
-            gene_ctx = getattr(vd, "gene_context", None)
-            if self.gene_symbol and (
-                gene_ctx is None or not getattr(gene_ctx, "symbol", "")
-            ):
-                vd.gene_context.symbol = self.gene_symbol
-        except (AttributeError, TypeError):
-            pass
+        if self.gene_symbol and not vd.gene_context.symbol:
+            vd.gene_context.symbol = self.gene_symbol
 
         # Add normalized g.HGVS only if not already present (dedupe patch)
-        g_value = self._normalize_g_expression(self.hgvsg)
         if g_value:
-            self._add_hgvs_expression_if_missing(vd, g_value, syntax_name="HGVS")
+            self._add_hgvs_expression_if_missing(vd, g_value)
 
         return vd
 
     # ---- Expression utilities -------------------------------------------------
 
     @staticmethod
-    def _expression_values(vd: "pps2.VariationDescriptor") -> set[str]:
-        """Collect all current Expression.value strings for fast membership checks."""
-        try:
-            return {e.value for e in vd.expressions}
-        except (AttributeError, TypeError):
-            return set()
+    def _has_expression_value(vd: "pps2.VariationDescriptor", value: str) -> bool:
+        """
+        True if any Expression on `vd` already carries `value`. Scans once and stops
+        at the first hit; descriptors hold only a handful of expressions and each is
+        checked once, so building a set per call would cost more than it saves.
+        """
+        return any(e.value == value for e in vd.expressions)
 
     @classmethod
     def _add_hgvs_expression_if_missing(
-        cls, vd: "pps2.VariationDescriptor", value: str, *, syntax_name: str = "HGVS"
+        cls, vd: "pps2.VariationDescriptor", value: str
     ) -> None:
         """
         Add a new HGVS Expression only if an identical value is not already present.
@@ -349,14 +689,12 @@ class Genotype:
         """
         if not value:
             return
-        if value in cls._expression_values(vd):
+        if cls._has_expression_value(vd, value):
             return
-        cls._add_hgvs_expression(vd, value, syntax_name=syntax_name)
+        cls._add_hgvs_expression(vd, value)
 
     @staticmethod
-    def _add_hgvs_expression(
-        vd: "pps2.VariationDescriptor", value: str, syntax_name: str = "HGVS"
-    ) -> None:
+    def _add_hgvs_expression(vd: "pps2.VariationDescriptor", value: str) -> None:
         """
         Append an Expression to a VariationDescriptor.
 
@@ -366,11 +704,9 @@ class Genotype:
             The descriptor to mutate.
         value : str
             HGVS string to append.
-        syntax_name : str, optional
-            Desired syntax enum name ('HGVS'), by default "HGVS".
+
+        Expression.syntax is a free-text string in this schema (there is no HGVS
+        enum to set), so only the value is filled in.
         """
         expr = vd.expressions.add()
         expr.value = value
-        enum = getattr(type(expr), syntax_name, None)
-        if enum is not None and hasattr(expr, "syntax"):
-            expr.syntax = enum  # type: ignore[attr-defined]
@@ -1,4 +1,5 @@
 import pandas as pd
+import typing
 
 # Columns that need renaming → target dataclass fields
 RENAME_MAP = {
@@ -35,33 +36,57 @@ def load_sheets_as_tables(workbook_path: str) -> dict[str, pd.DataFrame]:
       - normalize all headers to snake_case lowercase
       - apply renames from RENAME_MAP
     """
+    return dict(iter_sheets_as_tables(workbook_path))
 
-    excel = pd.ExcelFile(workbook_path, engine="openpyxl")
-    tables: dict[str, pd.DataFrame] = {}
 
-    for sheet_name in excel.sheet_names:
-        df = pd.read_excel(
-            excel, sheet_name=sheet_name, header=0, index_col=0, engine="openpyxl"
-        )
+def iter_sheets_as_tables(
+    workbook_path: str,
+) -> typing.Iterator[tuple[str, pd.DataFrame]]:
+    """
+    Yield (sheet_name, DataFrame) pairs one sheet at a time, normalized as in
+    load_sheets_as_tables. A consumer that keeps only the sheets it needs never
+    holds the rest of the workbook in memory.
+    """
+
+    # open the workbook once; every sheet is parsed from this handle, which is
+    # closed as soon as the last sheet has been read
+    with _open_workbook(workbook_path) as excel:
+        for sheet_name in excel.sheet_names:
+            yield (
+                sheet_name,
+                _normalize_headers(excel.parse(sheet_name, header=0, index_col=0)),
+            )
 
-        # CLEAN & NORMALIZE headers:
-        df.columns = (
-            df.columns.str.strip()
-            .str.replace(r"\s*\(.*?\)", "", regex=True)  # drop any "(…)"
-            .str.replace(r"\s+", "_", regex=True)  # spaces → underscore
-            .str.replace(":", "", regex=False)  # drop colons
-            .str.lower()
-        )
 
-        # apply specific renames (e.g. "ref" → "reference")
-        df = df.rename(
-            columns={
-                orig: target
-                for orig, target in RENAME_MAP.items()
-                if orig in df.columns
-            }
-        )
+def _normalize_headers(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Normalize headers to snake_case lowercase and apply RENAME_MAP.
+    """
 
-        tables[sheet_name] = df
+    # CLEAN & NORMALIZE headers:
+    df.columns = (
+        df.columns.str.strip()
+        .str.replace(r"\s*\(.*?\)", "", regex=True)  # drop any "(…)"
+        .str.replace(r"\s+", "_", regex=True)  # spaces → underscore
+        .str.replace(":", "", regex=False)  # drop colons
+        .str.lower()
+    )
 
-    return tables
+    # apply specific renames (e.g. "ref" → "reference")
+    return df.rename(
+        columns={
+            orig: target for orig, target in RENAME_MAP.items() if orig in df.columns
+        }
+    )
+
+
+def _open_workbook(workbook_path: str) -> pd.ExcelFile:
+    """
+    Open the workbook with the Rust-backed calamine reader, which parses .xlsx
+    an order of magnitude faster than openpyxl; fall back to openpyxl when
+    python-calamine is not installed.
+    """
+    try:
+        return pd.ExcelFile(workbook_path, engine="calamine")
+    except ImportError:
+        return pd.ExcelFile(workbook_path, engine="openpyxl")
@@ -10,10 +10,11 @@ from hpotk.validate import (
 )
 import pandas as pd
 import re
+import sys
 import typing
 
-from collections import defaultdict
 from dataclasses import dataclass
+from operator import attrgetter
 from phenopackets.schema.v2.phenopackets_pb2 import Phenopacket
 from stairval.notepad import Notepad
 from typing import List, TypeVar, Tuple
@@ -99,6 +100,36 @@ KNOWN_SHEET_ALIASES: dict[str, set[str]] = {
     "measurements": {"measurement", "measurements", "labs"},
     "biosamples": {"biosample", "biosamples", "samples"},
 }
+# Inverted view for a single pass over the workbook: alias → sheet kind
+_SHEET_KIND_BY_ALIAS: dict[str, str] = {
+    alias: kind for kind, aliases in KNOWN_SHEET_ALIASES.items() for alias in aliases
+}
+
+# Row-level patterns, compiled once at import rather than on every row
+# "HPO cell": optional label followed by the HPO code, e.g. "Seizure (HP:0001250)" or "1250"
+_HPO_CELL_PATTERN = re.compile(
+    r"""
+    ^\s*
+    (?P<label>.*?)              # optional label
+    \s*                         # whitespace
+    \(?                         # optional "("
+    (?:HP:?)?(?P<digits>\d+)    # digits, with optional "HP"
+    \)?                         # optional ")"
+    \s*$
+    """,
+    re.VERBOSE | re.IGNORECASE,
+)
+# Simple g. SNV used for the HGVS vs raw-coordinate consistency check
+_HGVSG_SNV_PATTERN = re.compile(
+    r"^(?:chr)?(?P<chromosome_name>[^:]+):g\.(?P<mutation_position>\d+)"
+    r"(?P<reference_allele>[ACGT]+)>(?P<alternative_allele>[ACGT]+)$",
+    re.IGNORECASE,
+)
+
+# Patient-ID accessors used when grouping records per patient
+_GENOTYPE_PATIENT_ID = attrgetter("genotype_patient_ID")
+_PHENOTYPE_PATIENT_ID = attrgetter("phenotype_patient_ID")
+_RECORD_PATIENT_ID = attrgetter("patient_ID")
 
 
 @dataclass
@@ -118,7 +149,10 @@ class TypedTables:
 class TableMapper(metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def apply_mapping(
-        self, tables: dict[str, pd.DataFrame], notepad: Notepad
+        self,
+        tables: typing.Mapping[str, pd.DataFrame]
+        | typing.Iterable[tuple[str, pd.DataFrame]],
+        notepad: Notepad,
     ) -> typing.Sequence[Phenopacket]:
         # return fully-assembled Phenopacket messages, not intermediate parts.
         raise NotImplementedError
@@ -134,7 +168,10 @@ class DefaultMapper(TableMapper):
         self.strict_variants = strict_variants
 
     def apply_mapping(
-        self, tables: dict[str, pd.DataFrame], notepad: Notepad
+        self,
+        tables: typing.Mapping[str, pd.DataFrame]
+        | typing.Iterable[tuple[str, pd.DataFrame]],
+        notepad: Notepad,
     ) -> list[Phenopacket]:
         """
         Process:
@@ -157,6 +194,10 @@ class DefaultMapper(TableMapper):
         )
         biosample_records = self._map_biosamples_table(typed_tables.biosamples, notepad)
 
+        # Resolve all VariantValidator lookups up front and concurrently, instead of
+        # one blocking HTTPS call per genotype while the packets are assembled.
+        vv_payloads = Genotype.prefetch_variant_validator(genotype_records)
+
         # apply_mapping.6) Group results by patient
         grouped = self._group_records_by_patient(
             genotype_records,
@@ -167,7 +208,9 @@ class DefaultMapper(TableMapper):
         )
 
         packets: list[Phenopacket] = [
-            self.construct_phenopacket_for_patient(patient_id, bundle, notepad)
+            self.construct_phenopacket_for_patient(
+                patient_id, bundle, notepad, vv_payloads=vv_payloads
+            )
             for patient_id, bundle in grouped.items()
         ]
 
@@ -287,7 +330,7 @@ class DefaultMapper(TableMapper):
             try:
                 genotypes.append(
                     Genotype(
-                        genotype_patient_ID=str(row["genotype_patient_ID"]),
+                        genotype_patient_ID=sys.intern(str(row["genotype_patient_ID"])),
                         contact_email=contact_email,
                         phasing=DefaultMapper._to_bool(row.get("phasing")),
                         # chromosome=str(row["chromosome"]),
@@ -334,19 +377,7 @@ class DefaultMapper(TableMapper):
             return [], []
 
         # Parse optional label and digits; extract the last token (it should just be the HPO code), case-insensitive
-        m = re.match(
-            r"""
-            ^\s*
-            (?P<label>.*?)              # optional label
-            \s*                         # whitespace
-            \(?                         # optional "("
-            (?:HP:?)?(?P<digits>\d+)    # digits, with optional "HP"
-            \)?                         # optional ")"
-            \s*$
-            """,
-            hpo_cell,
-            re.VERBOSE | re.IGNORECASE,
-        )
+        m = _HPO_CELL_PATTERN.match(hpo_cell)
         if not m:
             notepad.add_error(
                 f"Sheet {sheet_name!r}: Cannot parse HPO term+ID from {hpo_cell!r}"
@@ -355,7 +386,9 @@ class DefaultMapper(TableMapper):
 
         raw_label = m.group("label").strip()
         digits = m.group("digits")
-        curie = f"HP:{digits.zfill(7)}"
+        # the same patients and terms recur across many rows; intern them so the
+        # grouping dicts and records share one string object per value
+        curie = sys.intern(f"HP:{digits.zfill(7)}")
         term_id = hpotk.TermId.from_curie(curie)
 
         # 1) Normalize the date_of_observation
@@ -365,7 +398,7 @@ class DefaultMapper(TableMapper):
         # 2) Append the Phenotype record
         try:
             phenotype = Phenotype(
-                phenotype_patient_ID=str(row["phenotype_patient_ID"]),
+                phenotype_patient_ID=sys.intern(str(row["phenotype_patient_ID"])),
                 HPO_ID=curie,
                 date_of_observation=date_str,
                 status=DefaultMapper._to_bool(row.get("status")),
@@ -448,13 +481,8 @@ class DefaultMapper(TableMapper):
         """
         If both raw coordinates and HGVS notation are present, ensure that the genotype notations match
         """
-        pattern = re.compile(
-            r"^(?:chr)?(?P<chromosome_name>[^:]+):g\.(?P<mutation_position>\d+)"
-            r"(?P<reference_allele>[ACGT]+)>(?P<alternative_allele>[ACGT]+)$",
-            re.IGNORECASE,
-        )
         hgvs = str(item.get("hgvsg", "")).strip()
-        m = pattern.match(hgvs)
+        m = _HGVSG_SNV_PATTERN.match(hgvs)
         if not m:
             notepad.add_error(
                 f"Sheet {sheet_name!r}: malformed HGVS g. notation {hgvs!r}"
@@ -511,25 +539,31 @@ class DefaultMapper(TableMapper):
         return working.rename(columns={original: patient_id_column})
 
     def _choose_named_tables(
-        self, tables: dict[str, pd.DataFrame], notepad: Notepad
+        self,
+        tables: typing.Mapping[str, pd.DataFrame]
+        | typing.Iterable[tuple[str, pd.DataFrame]],
+        notepad: Notepad,
     ) -> TypedTables:
         """
         Prefer explicit sheet names (plus common aliases).
+        Accepts a mapping or a stream of (sheet_name, DataFrame) pairs; sheets are
+        visited once and unrecognized ones are not retained.
         """
 
-        def by_alias(kind: str) -> pd.DataFrame | None:
-            aliases = KNOWN_SHEET_ALIASES[kind]
-            for sheet_name, df in tables.items():
-                if sheet_name.strip().casefold() in aliases:
-                    return df
-            return None
+        chosen: dict[str, pd.DataFrame] = {}
+        pairs = tables.items() if isinstance(tables, typing.Mapping) else tables
+        for sheet_name, df in pairs:
+            kind = _SHEET_KIND_BY_ALIAS.get(sheet_name.strip().casefold())
+            # first matching sheet wins, as with the ordered alias lookup
+            if kind is not None and kind not in chosen:
+                chosen[kind] = df
 
         selected = TypedTables(
-            genotype=by_alias("genotype"),
-            phenotype=by_alias("phenotype"),
-            diseases=by_alias("diseases"),
-            measurements=by_alias("measurements"),
-            biosamples=by_alias("biosamples"),
+            genotype=chosen.get("genotype"),
+            phenotype=chosen.get("phenotype"),
+            diseases=chosen.get("diseases"),
+            measurements=chosen.get("measurements"),
+            biosamples=chosen.get("biosamples"),
         )
 
         # Hard-minimum: at least genotype or phenotype must exist
@@ -665,7 +699,7 @@ class DefaultMapper(TableMapper):
         for index, row in df.iterrows():
             try:
                 disease_record = DiseaseRecord(
-                    patient_ID=str(row["patient_ID"]),
+                    patient_ID=sys.intern(str(row["patient_ID"])),
                     disease_term=str(row["disease_term"]).strip(),
                     disease_label=(str(row.get("disease_label", "")).strip() or None),
                     disease_onset=str(row["disease_onset"]).strip(),
@@ -705,7 +739,7 @@ class DefaultMapper(TableMapper):
                 )
 
                 measurement_record = MeasurementRecord(
-                    patient_ID=str(row["patient_ID"]),
+                    patient_ID=sys.intern(str(row["patient_ID"])),
                     measurement_type=str(row["measurement_type"]).strip(),
                     measurement_value=float(row["measurement_value"]),
                     measurement_unit=str(row["measurement_unit"]).strip(),
@@ -745,7 +779,7 @@ class DefaultMapper(TableMapper):
                 )
 
                 biosample_record = BiosampleRecord(
-                    patient_ID=str(row["patient_ID"]),
+                    patient_ID=sys.intern(str(row["patient_ID"])),
                     biosample_id=str(row["biosample_id"]).strip(),
                     biosample_type=str(row["biosample_type"]).strip(),
                     collection_date=collection_date,
@@ -756,8 +790,8 @@ class DefaultMapper(TableMapper):
         return records
 
     # Grouping and phenopacket construction
+    @staticmethod
     def _group_records_by_patient(
-        self,
         genotype_records: list[Genotype],
         phenotype_records: list[Phenotype],
         disease_records: list[DiseaseRecord],
@@ -767,35 +801,42 @@ class DefaultMapper(TableMapper):
         """
         Group all domain records by patient identifier, producing a bundle per patient
         """
-        grouped = defaultdict(
-            lambda: {
-                "genotype_records": [],
-                "phenotype_records": [],
-                "disease_records": [],
-                "measurement_records": [],
-                "biosample_records": [],
-            }
-        )
-        for genotype in genotype_records:
-            grouped[genotype.genotype_patient_ID]["genotype_records"].append(genotype)
-        for phenotype in phenotype_records:
-            grouped[phenotype.phenotype_patient_ID]["phenotype_records"].append(
-                phenotype
-            )
-        for disease in disease_records:
-            grouped[disease.patient_ID]["disease_records"].append(disease)
-        for measurement in measurement_records:
-            grouped[measurement.patient_ID]["measurement_records"].append(measurement)
-        for biosample in biosample_records:
-            grouped[biosample.patient_ID]["biosample_records"].append(biosample)
+        # Plain dict with an explicit miss branch: no factory call per new patient,
+        # and patients keep first-seen order (a set-based prepass would not).
+        grouped: dict[str, dict[str, list]] = {}
+        # One loop over every record type; attrgetter pulls the patient ID in C.
+        for bucket_name, patient_id_of, records in (
+            ("genotype_records", _GENOTYPE_PATIENT_ID, genotype_records),
+            ("phenotype_records", _PHENOTYPE_PATIENT_ID, phenotype_records),
+            ("disease_records", _RECORD_PATIENT_ID, disease_records),
+            ("measurement_records", _RECORD_PATIENT_ID, measurement_records),
+            ("biosample_records", _RECORD_PATIENT_ID, biosample_records),
+        ):
+            for record in records:
+                patient_id = patient_id_of(record)
+                bundle = grouped.get(patient_id)
+                if bundle is None:
+                    bundle = grouped[patient_id] = {
+                        "genotype_records": [],
+                        "phenotype_records": [],
+                        "disease_records": [],
+                        "measurement_records": [],
+                        "biosample_records": [],
+                    }
+                bundle[bucket_name].append(record)
         return grouped
 
     def construct_phenopacket_for_patient(
-        self, patient_id: str, bundle: dict[str, list], notepad: Notepad
+        self,
+        patient_id: str,
+        bundle: dict[str, list],
+        notepad: Notepad,
+        vv_payloads: typing.Optional[typing.Mapping] = None,
     ) -> Phenopacket:
         """
         Build a Phenopacket for a single patient using their grouped records.
         Field assignments follow the explicit naming and serialization style.
+        `vv_payloads` is the result of Genotype.prefetch_variant_validator, if any.
         """
 
         phenopacket = Phenopacket()
@@ -807,7 +848,7 @@ class DefaultMapper(TableMapper):
 
         # 2) Genotype interpretations (minimal HGVS expression to start)
         self._add_genotype_interpretations(
-            phenopacket, bundle.get("genotype_records", []), patient_id
+            phenopacket, bundle.get("genotype_records", []), patient_id, vv_payloads
         )
 
         # 3) Optional sections (diseases, measurements, biosamples).
@@ -837,7 +878,12 @@ class DefaultMapper(TableMapper):
 
     @staticmethod
     @staticmethod
-    def _add_genotype_interpretations(pkt, genotypes: list, patient_id: str) -> None:
+    def _add_genotype_interpretations(
+        pkt,
+        genotypes: list,
+        patient_id: str,
+        vv_payloads: typing.Optional[typing.Mapping] = None,
+    ) -> None:
         """
         Add Interpretation → Diagnosis → GenomicInterpretation blocks.
         Use the Genotype dataclass helper to build VariationDescriptor,
@@ -862,7 +908,9 @@ class DefaultMapper(TableMapper):
             variation_descriptor = variant_interpretation.variation_descriptor
 
             try:
-                variation_descriptor.CopyFrom(genotype_record.to_variation_descriptor())
+                variation_descriptor.CopyFrom(
+                    genotype_record.to_variation_descriptor(vv_payloads)
+                )
             except AttributeError:
                 # Fallback to old behavior if helper not available
                 expression = variation_descriptor.expressions.add()
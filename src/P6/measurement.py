@@ -7,7 +7,7 @@ Defines the MeasurementRecord dataclass for capturing quantitative measurements.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class MeasurementRecord:
     """
     Represents a measurement entry for a patient.
@@ -8,12 +8,13 @@ import re
 from dataclasses import dataclass
 
 # Patterns
-_VALID_ID = re.compile(r"^[A-Za-z0-9]+$")
 _HPO_ID_PATTERN = re.compile(r"^(?:HP:\d{7}|\d{7})$")
 _TIMESTAMP_PATTERN = re.compile(r"^T\d+$")
+_HPO_ID_MATCH = _HPO_ID_PATTERN.match
+_TIMESTAMP_MATCH = _TIMESTAMP_PATTERN.match
 
 
-@dataclass
+@dataclass(slots=True)
 class Phenotype:
     """
     Represents a single HPO annotation for a patient at a given timestamp.
@@ -31,18 +32,24 @@ class Phenotype:
     status: bool
 
     def __post_init__(self):
-        # Validate patient ID
-        if not _VALID_ID.match(self.phenotype_patient_ID):
-            raise ValueError(f"Invalid patient ID: {self.phenotype_patient_ID!r}")
+        # Validate patient ID: ASCII-alphanumeric and non-empty, the same rule as
+        # Genotype (a ^...$ regex would also accept a trailing newline)
+        patient_id = self.phenotype_patient_ID
+        if not (
+            isinstance(patient_id, str)
+            and patient_id.isascii()
+            and patient_id.isalnum()
+        ):
+            raise ValueError(f"Invalid patient ID: {patient_id!r}")
 
         # Validate HPO ID
-        if not _HPO_ID_PATTERN.match(self.HPO_ID):
+        if not _HPO_ID_MATCH(self.HPO_ID):
             raise ValueError(f"Invalid HPO ID: {self.HPO_ID!r}")
 
         # Validate timestamp
-        if not isinstance(
-            self.date_of_observation, str
-        ) or not _TIMESTAMP_PATTERN.match(self.date_of_observation):
+        if not isinstance(self.date_of_observation, str) or not _TIMESTAMP_MATCH(
+            self.date_of_observation
+        ):
             raise ValueError(
                 f"Invalid date_of_observation: {self.date_of_observation!r}"
             )
@@ -37,6 +37,7 @@ import time
 from urllib.parse import quote as _urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
 
 
 class VVLookupError(RuntimeError):
@@ -49,6 +50,17 @@ class VVLookupError(RuntimeError):
 
 _VV_BASE = os.getenv("VV_BASE_URL", "https://rest.variantvalidator.org").rstrip("/")
 
+# One pooled session for all VV traffic (also used by genotype.py for the
+# pyphetools calls): keep-alive connections are reused, so repeated lookups skip
+# the TCP + TLS handshake. Retries stay in _request_json (an adapter-level Retry
+# would multiply with that loop).
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+SESSION.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
+# Seconds to wait on a VV connect/read before giving up on a request
+REQUEST_TIMEOUT = 10.0
+
 
 # ------------------------------------------------------------------------------
 # Small utilities
@@ -63,7 +75,7 @@ def _sleep_backoff(i: int) -> None:
     time.sleep(0.25 * (2**i))
 
 
-def _request_json(url: str, *, timeout: float = 10.0) -> dict:
+def _request_json(url: str, *, timeout: float = REQUEST_TIMEOUT) -> dict:
     """
     GET JSON with simple retry/backoff for VV endpoints.
 
@@ -73,7 +85,7 @@ def _request_json(url: str, *, timeout: float = 10.0) -> dict:
     last_exc: Exception | None = None
     for i in range(4):  # attempts: 0,1,2,3
         try:
-            resp = requests.get(url, timeout=timeout)
+            resp = SESSION.get(url, timeout=timeout)
             resp.raise_for_status()
             return resp.json()
         except (requests.RequestException, json.JSONDecodeError, ValueError) as e:
@@ -2,6 +2,8 @@ import hpotk
 import os
 import pytest
 
+from P6 import genotype
+
 
 @pytest.fixture(scope="session")
 def fpath_test_dir() -> str:
@@ -23,3 +25,16 @@ def hpo(fpath_hpo: str) -> hpotk.MinimalOntology:
     `hpotk` should be able to read this directly without manual decompression.
     """
     return hpotk.load_minimal_ontology(fpath_hpo)
+
+
+@pytest.fixture(autouse=True)
+def isolated_vv_cache(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    """
+    Keep every test's VariantValidator disk cache under `tmp_path`, so the suite
+    never reads or creates the user's ~/.cache/P6/vv.sqlite3.
+    """
+    monkeypatch.setenv("P6_VV_CACHE_PATH", str(tmp_path / "vv.sqlite3"))
+    genotype.refresh_env_flags()
+    yield
+    monkeypatch.undo()
+    genotype.refresh_env_flags()
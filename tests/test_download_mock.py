@@ -3,12 +3,19 @@ Isolated test for the 'download' command without hitting the network.
 
 We patch requests.get twice:
 - first for the 'latest release' lookup (returns {'tag_name': 'vX'})
-- second for the actual file download (returns the file content).
+- second for the actual file download (a streamed response yielding the file content).
+
+A second run for the same release must send the stored ETag and keep hp.json on a 304;
+an interrupted download must leave neither a partial hp.json nor a stale ETag behind.
 """
 
+import json
+import os
+import stat
+
 from click.testing import CliRunner
-from unittest.mock import patch, Mock
-from P6.__main__ import main
+from unittest.mock import patch, MagicMock, Mock
+from P6.__main__ import _read_download_cache, main
 
 
 def test_download_mocks_network(tmp_path):
@@ -17,10 +24,71 @@ def test_download_mocks_network(tmp_path):
     def fake_get(url, *args, **kwargs):
         if url.endswith("/releases/latest"):
             return Mock(status_code=200, json=lambda: {"tag_name": "vX"})
-        # second call returns the content of hp.json
-        return Mock(status_code=200, content=b"{}")
+        # second call streams the content of hp.json in chunks
+        assert kwargs.get("stream") is True
+        resp = MagicMock(status_code=200, headers={"ETag": '"abc"'})
+        resp.__enter__.return_value = resp
+        resp.iter_content.return_value = [b'{"graphs"', b": []}"]
+        return resp
 
-    with patch("P6.__main__.requests.get", side_effect=fake_get):
+    with patch("requests.get", side_effect=fake_get):
         res = runner.invoke(main, ["download", "-d", str(tmp_path)])
         assert res.exit_code == 0
-        assert (tmp_path / "hp.json").exists()
+        assert (tmp_path / "hp.json").read_bytes() == b'{"graphs": []}'
+        assert json.loads((tmp_path / ".hpo_cache.json").read_text()) == {
+            "etag": '"abc"',
+            "tag": "vX",
+        }
+        # same permissions as a file created with open(): 0666 minus the umask
+        umask = os.umask(0)
+        os.umask(umask)
+        assert stat.S_IMODE((tmp_path / "hp.json").stat().st_mode) == 0o666 & ~umask
+
+
+def test_download_skips_unchanged_release(tmp_path):
+    runner = CliRunner()
+    (tmp_path / "hp.json").write_bytes(b"cached")
+    (tmp_path / ".hpo_cache.json").write_text('{"etag": "\\"abc\\"", "tag": "vX"}')
+    sent_headers = []
+
+    def fake_get(url, *args, **kwargs):
+        sent_headers.append(kwargs.get("headers"))
+        resp = MagicMock(status_code=304)
+        resp.__enter__.return_value = resp
+        return resp
+
+    with patch("requests.get", side_effect=fake_get):
+        res = runner.invoke(main, ["download", "-d", str(tmp_path), "-v", "X"])
+        assert res.exit_code == 0
+        assert "already up to date" in res.output
+        assert sent_headers == [{"If-None-Match": '"abc"'}]
+        assert (tmp_path / "hp.json").read_bytes() == b"cached"
+
+
+def test_interrupted_download_keeps_old_file_and_drops_etag(tmp_path):
+    runner = CliRunner()
+    (tmp_path / "hp.json").write_bytes(b"release-X")
+    (tmp_path / ".hpo_cache.json").write_text('{"etag": "E", "tag": "vX"}')
+
+    def broken_stream(chunk_size):
+        yield b"PARTIAL-Y"
+        raise ConnectionError("connection reset")
+
+    def fake_get(url, *args, **kwargs):
+        resp = MagicMock(status_code=200, headers={"ETag": "F"})
+        resp.__enter__.return_value = resp
+        resp.iter_content.side_effect = broken_stream
+        return resp
+
+    with patch("requests.get", side_effect=fake_get):
+        res = runner.invoke(main, ["download", "-d", str(tmp_path), "-v", "Y"])
+        assert res.exit_code != 0
+        assert (tmp_path / "hp.json").read_bytes() == b"release-X"
+        assert not (tmp_path / ".hpo_cache.json").exists()
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["hp.json"]
+
+
+def test_read_download_cache_ignores_non_object_json(tmp_path):
+    cache_file = tmp_path / ".hpo_cache.json"
+    cache_file.write_text('["vX", "E"]')
+    assert _read_download_cache(cache_file) == {}
@@ -1,4 +1,8 @@
+import phenopackets.schema.v2 as pps2
 import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock
+from P6 import genotype
 from P6.genotype import Genotype
 
 
@@ -23,7 +27,7 @@ def test_valid_genotype_instantiation():
     assert isinstance(g, Genotype)
 
 
-@pytest.mark.parametrize("bad_id", ["", "123-!"])
+@pytest.mark.parametrize("bad_id", ["", "123-!", "PAT\u00e91", "PAT1\n"])
 def test_invalid_patient_id_raises(bad_id):
     """Non‑alphanumeric IDs must trigger a ValueError."""
     with pytest.raises(ValueError):
@@ -65,3 +69,219 @@ def test_invalid_email_format_raises(bad_email):
             zygosity="mosaic",
             inheritance="de_novo_mutation",
         )
+
+
+@pytest.mark.parametrize("bad_position", [-1, True, 1.0, "1"])
+def test_invalid_start_position_raises(bad_position):
+    """Positions must be plain non-negative ints (bools are rejected too)."""
+    with pytest.raises(ValueError, match="start_position"):
+        Genotype(
+            genotype_patient_ID="PAT1",
+            contact_email="a@b.com",
+            phasing=False,
+            chromosome="chr16",
+            start_position=bad_position,
+            end_position=100,
+            reference="A",
+            alternate="G",
+            gene_symbol="GENE",
+            hgvsg="chr16:g.100A>G",
+            hgvsc="NM_000001.1:c.5A>G",
+            hgvsp="p.?",
+            zygosity="heterozygous",
+            inheritance="inherited",
+        )
+
+
+@pytest.mark.parametrize("zygosity", sorted(genotype._ALLOWED_ZYGOSITIES))
+def test_every_allowed_zygosity_has_a_geno_code(zygosity):
+    g = _genotype_with_hgvsc("NM_000001.1:c.5A>G", zygosity=zygosity)
+    assert g._allelic_state_id() == f"GENO:{g.zygosity_code}"
+
+
+def _genotype_with_hgvsc(hgvsc, zygosity="heterozygous"):
+    return Genotype(
+        genotype_patient_ID="PAT1",
+        contact_email="a@b.com",
+        phasing=False,
+        chromosome="chr16",
+        start_position=100,
+        end_position=100,
+        reference="A",
+        alternate="G",
+        gene_symbol="GENE",
+        hgvsg="chr16:g.100A>G",
+        hgvsc=hgvsc,
+        hgvsp="p.?",
+        zygosity=zygosity,
+        inheritance="inherited",
+    )
+
+
+@pytest.fixture
+def fake_vv(monkeypatch):
+    """
+    Route VV lookups to an in-memory fake; yields the list of (tx, c.) calls.
+    Descriptor ids echo the c. part; "c.1A>G" is rejected like a VV error.
+    """
+    calls = []
+
+    class FakeValidator:
+        def __init__(self, genome_build, transcript):
+            self.transcript = transcript
+
+        def encode_hgvs(self, c_part):
+            calls.append((self.transcript, c_part))
+            if c_part == "c.1A>G":
+                raise ValueError("VV rejected the variant")
+            message = pps2.VariationDescriptor(id=f"vv-{c_part}")
+            wrapper = SimpleNamespace(to_message=lambda: message)
+            return SimpleNamespace(
+                to_variant_interpretation_202=lambda: SimpleNamespace(
+                    variation_descriptor=wrapper
+                )
+            )
+
+    monkeypatch.delenv("P6_SKIP_VV", raising=False)
+    monkeypatch.delenv("P6_VV_CACHE", raising=False)
+    genotype.refresh_env_flags()
+    monkeypatch.setattr(genotype, "_variant_validator_class", lambda: FakeValidator)
+    monkeypatch.setattr(genotype._vv_rate_limiter, "wait", lambda: None)
+    genotype._vv_encode.cache_clear()
+    yield calls
+    genotype._vv_encode.cache_clear()
+
+
+def test_variant_validator_lookups_are_memoized(fake_vv):
+    """Repeated (transcript, c.) pairs hit VV once; failures are cached too."""
+    first = _genotype_with_hgvsc("NM_000001.1:c.100A>G").to_variation_descriptor()
+    second = _genotype_with_hgvsc("NM_000001.1:c.100A>G").to_variation_descriptor()
+    failed = [
+        _genotype_with_hgvsc("NM_000001.1:c.1A>G").to_variation_descriptor()
+        for _ in range(2)
+    ]
+
+    assert fake_vv == [("NM_000001.1", "c.100A>G"), ("NM_000001.1", "c.1A>G")]
+    assert first.id == second.id == "vv-c.100A>G"
+    assert first is not second
+    assert all(vd.id == "" for vd in failed)  # local fallback
+
+
+def test_bulk_to_variation_descriptors_keeps_order(fake_vv):
+    """Each distinct pair is fetched once; results come back in input order."""
+    hgvscs = ["NM_000001.1:c.3A>G", "NM_000001.1:c.2A>G", "NM_000001.1:c.3A>G"]
+    genotypes = [_genotype_with_hgvsc(h) for h in hgvscs]
+
+    descriptors = Genotype.bulk_to_variation_descriptors(genotypes, max_workers=2)
+
+    assert [vd.id for vd in descriptors] == ["vv-c.3A>G", "vv-c.2A>G", "vv-c.3A>G"]
+    assert sorted(fake_vv) == [("NM_000001.1", "c.2A>G"), ("NM_000001.1", "c.3A>G")]
+
+
+def test_prefetched_payloads_survive_memo_eviction(fake_vv, monkeypatch):
+    """Descriptors are built from the prefetch result, not the bounded memo."""
+    monkeypatch.setenv("P6_VV_CACHE", "0")
+    genotype.refresh_env_flags()
+    genotypes = [_genotype_with_hgvsc(f"NM_000001.1:c.{i}A>G") for i in (1, 2, 3)]
+
+    vv_payloads = Genotype.prefetch_variant_validator(genotypes, max_workers=2)
+    genotype._vv_encode.cache_clear()  # as if a large batch had evicted them
+    descriptors = [g.to_variation_descriptor(vv_payloads) for g in genotypes]
+
+    assert vv_payloads[("NM_000001.1", "c.1A>G")] is None
+    assert [vd.id for vd in descriptors][1:] == ["vv-c.2A>G", "vv-c.3A>G"]
+    assert len(fake_vv) == 3
+
+
+def test_variant_validator_failure_falls_back_locally(fake_vv, caplog):
+    with caplog.at_level("DEBUG", logger="P6.genotype"):
+        vd = _genotype_with_hgvsc("NM_000001.1:c.1A>G").to_variation_descriptor()
+
+    assert not vd.id.startswith("vv-")
+    assert "VV rejected the variant" in caplog.text
+
+
+def test_variant_validator_results_persist_across_runs(fake_vv, monkeypatch):
+    """A later run reads successful lookups from disk; P6_VV_CACHE=0 bypasses it."""
+    _genotype_with_hgvsc("NM_000001.1:c.5A>G").to_variation_descriptor()
+    genotype._vv_encode.cache_clear()  # as if in a new process
+
+    again = _genotype_with_hgvsc("NM_000001.1:c.5A>G").to_variation_descriptor()
+    assert again.id == "vv-c.5A>G"
+    assert fake_vv == [("NM_000001.1", "c.5A>G")]
+
+    monkeypatch.setenv("P6_VV_CACHE", "0")
+    genotype.refresh_env_flags()
+    genotype._vv_encode.cache_clear()
+    _genotype_with_hgvsc("NM_000001.1:c.5A>G").to_variation_descriptor()
+    assert len(fake_vv) == 2
+
+
+def test_vv_cache_path_follows_xdg_cache_home(monkeypatch, tmp_path):
+    monkeypatch.delenv("P6_VV_CACHE_PATH")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert genotype._env_cache_path() == tmp_path / "P6" / "vv.sqlite3"
+
+
+def test_variant_validator_disk_cache_evicts_oldest(fake_vv, monkeypatch):
+    monkeypatch.setattr(genotype, "_VV_CACHE_MAX_ENTRIES", 2)
+    for c_part in ("c.5A>G", "c.6A>G", "c.7A>G"):
+        genotype._vv_disk_put("NM_000001.1", c_part, b"x")
+
+    assert genotype._vv_disk_get("NM_000001.1", "c.5A>G") is None
+    assert genotype._vv_disk_get("NM_000001.1", "c.7A>G") == b"x"
+
+
+@pytest.mark.parametrize(
+    "hgvsg, expected",
+    [
+        ("chr16:g.100A>G", "16:g.100A>G"),  # canonical fast path
+        ("X:g.5C>T", "X:g.5C>T"),
+        ("chr1:g.100a>g", "1:g.100A>G"),  # regex path upper-cases alleles
+        ("chrX:g.10AC>GT", "X:g.10AC>GT"),
+        ("chr1:g.100_101del", "1:g.100_101del"),  # non-SNV: only "chr" dropped
+        ("  ", None),
+    ],
+)
+def test_normalize_g_expression(hgvsg, expected):
+    assert Genotype._normalize_g_expression(hgvsg) == expected
+
+
+def test_add_hgvs_expression_if_missing_skips_duplicates():
+    vd = pps2.VariationDescriptor()
+    Genotype._add_hgvs_expression_if_missing(vd, "16:g.100A>G")
+    Genotype._add_hgvs_expression_if_missing(vd, "16:g.100A>G")
+    Genotype._add_hgvs_expression_if_missing(vd, "16:g.200C>T")
+    assert [e.value for e in vd.expressions] == ["16:g.100A>G", "16:g.200C>T"]
+
+
+def test_variant_validator_uses_pooled_session_only_while_calling(monkeypatch):
+    import requests
+    from pyphetools.creation import variant_validator
+
+    from P6 import vv_lookup
+
+    get = Mock()
+    monkeypatch.setattr(vv_lookup.SESSION, "get", get)
+
+    with genotype._vv_pooled_requests:
+        variant_validator.requests.get("https://vv.test/x")
+        assert variant_validator.requests.exceptions is requests.exceptions
+
+    get.assert_called_once_with("https://vv.test/x", timeout=vv_lookup.REQUEST_TIMEOUT)
+    assert variant_validator.requests is requests
+
+
+def test_rate_limiter_spaces_calls(monkeypatch):
+    clock = [100.0]
+    sleeps = []
+    monkeypatch.setattr(genotype.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(genotype.time, "sleep", sleeps.append)
+
+    limiter = genotype._RateLimiter(rate=4.0)
+    for _ in range(3):
+        limiter.wait()
+    clock[0] += 10.0  # long idle gap: no catch-up burst is owed, no wait
+    limiter.wait()
+
+    assert sleeps == [0.25, 0.5]
@@ -0,0 +1,59 @@
+"""
+Tests for loader.load_sheets_as_tables:
+- headers are normalized and renamed via RENAME_MAP
+- the openpyxl engine is used when python-calamine is unavailable
+- iter_sheets_as_tables yields the same sheets lazily
+"""
+
+import pandas as pd
+import pytest
+from P6 import loader
+from P6.loader import iter_sheets_as_tables, load_sheets_as_tables
+
+
+@pytest.fixture
+def tiny_workbook(tmp_path):
+    df = pd.DataFrame(
+        {"HPO Term": ["HP:0001250"], "Timestamp": ["T0"], "Status": [1]},
+        index=pd.Index(["PAT1"], name="Patient ID"),
+    )
+    path = tmp_path / "tiny.xlsx"
+    with pd.ExcelWriter(path, engine="openpyxl") as w:
+        df.to_excel(w, sheet_name="phenotype")
+    return str(path)
+
+
+def test_load_sheets_normalizes_and_renames_headers(tiny_workbook):
+    tables = load_sheets_as_tables(tiny_workbook)
+    assert list(tables) == ["phenotype"]
+    assert list(tables["phenotype"].columns) == [
+        "hpo_id",
+        "date_of_observation",
+        "status",
+    ]
+    assert tables["phenotype"].index.tolist() == ["PAT1"]
+
+
+def test_load_sheets_falls_back_to_openpyxl(tiny_workbook, monkeypatch):
+    real_excel_file = pd.ExcelFile
+    engines = []
+
+    def excel_file_without_calamine(path, engine=None, **kwargs):
+        engines.append(engine)
+        if engine == "calamine":
+            raise ImportError("python-calamine is not installed")
+        return real_excel_file(path, engine=engine, **kwargs)
+
+    monkeypatch.setattr(loader.pd, "ExcelFile", excel_file_without_calamine)
+    tables = load_sheets_as_tables(tiny_workbook)
+
+    assert engines == ["calamine", "openpyxl"]
+    assert "hpo_id" in tables["phenotype"].columns
+
+
+def test_iter_sheets_yields_lazily(tiny_workbook):
+    sheets = iter_sheets_as_tables(tiny_workbook)
+    name, df = next(sheets)
+    assert name == "phenotype"
+    assert "hpo_id" in df.columns
+    assert next(sheets, None) is None
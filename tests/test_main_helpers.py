@@ -2,10 +2,23 @@
 Unit tests for small helpers in __main__.py:
 - _prepare_output_dir: creates timestamped folder
 - _report_issues: prints warnings/errors to stdout
+- _group_records_by_patient: buckets records per patient ID
+- _write_phenopacket_archive: one compact JSON line per phenopacket, gzipped
+- _write_phenopacket_pb: binary protobuf that parses back to the same message
 """
 
+import gzip
+import json
 import re
-from P6.__main__ import _prepare_output_dir, _report_issues
+from types import SimpleNamespace
+from P6.__main__ import (
+    _group_records_by_patient,
+    _prepare_output_dir,
+    _report_issues,
+    _write_phenopacket_archive,
+    _write_phenopacket_pb,
+)
+from phenopackets.schema.v2.phenopackets_pb2 import Phenopacket
 from stairval.notepad import create_notepad
 
 
@@ -34,3 +47,44 @@ def test_report_issues_outputs_both_blocks(capsys):
     assert "warn 1" in out
     assert "Errors found in mapping" in out
     assert "err 1" in out
+
+
+def test_group_records_by_patient_buckets_every_record_type():
+    """
+    Each record lands in its patient's bucket, and patients keep first-seen order.
+    """
+    genotype = SimpleNamespace(genotype_patient_ID="P2")
+    phenotypes = [
+        SimpleNamespace(phenotype_patient_ID="P1"),
+        SimpleNamespace(phenotype_patient_ID="P2"),
+    ]
+    disease = SimpleNamespace(patient_ID="P1")
+
+    grouped = _group_records_by_patient([genotype], phenotypes, [disease], [], [])
+
+    assert list(grouped) == ["P2", "P1"]
+    assert grouped["P2"]["genotype_records"] == [genotype]
+    assert grouped["P2"]["phenotype_records"] == [phenotypes[1]]
+    assert grouped["P1"]["phenotype_records"] == [phenotypes[0]]
+    assert grouped["P1"]["disease_records"] == [disease]
+    assert grouped["P1"]["biosample_records"] == []
+
+
+def test_write_phenopacket_archive_writes_one_line_per_packet(tmp_path):
+    archive = tmp_path / "phenopackets.jsonl.gz"
+    packets = [Phenopacket(id="P1"), Phenopacket(id="P2")]
+
+    assert _write_phenopacket_archive(packets, archive) == 2
+
+    lines = gzip.decompress(archive.read_bytes()).splitlines()
+    assert [json.loads(line)["id"] for line in lines] == ["P1", "P2"]
+
+
+def test_write_phenopacket_pb_round_trips(tmp_path):
+    path = tmp_path / "1.pb"
+    packet = Phenopacket(id="P1")
+    packet.subject.id = "P1"
+
+    _write_phenopacket_pb(packet, path)
+
+    assert Phenopacket.FromString(path.read_bytes()) == packet
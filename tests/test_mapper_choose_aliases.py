@@ -21,3 +21,15 @@ def test_choose_named_tables_aliases():
     assert selected.genotype is not None
     assert selected.phenotype is not None
     assert selected.measurements is not None
+
+
+def test_choose_named_tables_from_stream_keeps_first_match():
+    m = DefaultMapper(hpotk.load_minimal_ontology(HPO_PATH))
+    note = create_notepad("alias-stream")
+    first, second = pd.DataFrame({"a": [1]}), pd.DataFrame({"a": [2]})
+    pairs = iter(
+        [("Genotype ", first), ("notes", pd.DataFrame()), ("variants", second)]
+    )
+    selected = m._choose_named_tables(pairs, note)
+    assert selected.genotype is first
+    assert selected.phenotype is None
@@ -13,6 +13,18 @@ def test_valid_phenotype_instantiation():
     assert isinstance(p, Phenotype)
 
 
+@pytest.mark.parametrize("bad_id", ["", "P-1", "P\u00e91", "PAT1\n"])
+def test_invalid_patient_id_raises(bad_id):
+    """Patient IDs follow the same ASCII-alphanumeric rule as Genotype."""
+    with pytest.raises(ValueError):
+        Phenotype(
+            phenotype_patient_ID=bad_id,
+            HPO_ID="HP:0001250",
+            date_of_observation="T0",
+            status=True,
+        )
+
+
 @pytest.mark.parametrize("bad_hpo", ["HP:123", "000123", "HP:ABCDEF1"])
 def test_invalid_hpo_id_raises(bad_hpo):
     """Malformed HPO IDs must trigger a ValueError."""
@@ -0,0 +1,29 @@
+"""
+Tests for vv_lookup._request_json without hitting the network:
+- requests go through the shared pooled session
+- failures are retried, then surfaced as VVLookupError
+"""
+
+from unittest.mock import Mock
+
+import pytest
+import requests
+from P6 import vv_lookup
+
+
+def test_request_json_uses_pooled_session(monkeypatch):
+    get = Mock(return_value=Mock(json=lambda: {"ok": True}))
+    monkeypatch.setattr(vv_lookup.SESSION, "get", get)
+
+    assert vv_lookup._request_json("https://vv.test/x") == {"ok": True}
+    get.assert_called_once_with("https://vv.test/x", timeout=10.0)
+
+
+def test_request_json_raises_after_retries(monkeypatch):
+    get = Mock(side_effect=requests.ConnectionError("down"))
+    monkeypatch.setattr(vv_lookup.SESSION, "get", get)
+    monkeypatch.setattr(vv_lookup, "_sleep_backoff", lambda i: None)
+
+    with pytest.raises(vv_lookup.VVLookupError):
+        vv_lookup._request_json("https://vv.test/x")
+    assert get.call_count == 4